@@ -1 +1,21 @@
 __version__ = "2.0.0"
+
+from importlib import import_module
+
+# Public API, resolved on first use so that importing the light modules
+# (accuracy metrics, smart correction) does not pull in torch.
+_EXPORTS = {
+    'recognize_text': 'text_recognizer',
+    'recognize_text_batch': 'text_recognizer',
+    'recognize_multi': 'multi_ocr',
+    'get_detailed_metrics': 'accuracy_metrics',
+    'compare_engines': 'accuracy_metrics',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f'.{_EXPORTS[name]}', __name__), name)
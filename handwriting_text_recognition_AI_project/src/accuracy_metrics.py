@@ -1,26 +1,80 @@
 import re
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence, Tuple
 
+try:
+    from rapidfuzz import process
+    from rapidfuzz.distance import Levenshtein
+except ImportError:
+    process = None
+    Levenshtein = None
 
-def calculate_levenshtein_distance(s1: str, s2: str) -> int:
-    """Calculate Levenshtein distance between two strings."""
+
+def calculate_levenshtein_distance(s1: str, s2: str, max_distance: Optional[int] = None) -> int:
+    """
+    Calculate Levenshtein distance between two strings.
+    If max_distance is given, the computation stops as soon as the distance is
+    known to exceed it and max_distance + 1 is returned instead.
+    """
+    if Levenshtein is not None:
+        return Levenshtein.distance(s1, s2, score_cutoff=max_distance)
+    return _levenshtein_fallback(s1, s2, max_distance)
+
+
+def _levenshtein_fallback(s1: Sequence, s2: Sequence, max_distance: Optional[int] = None) -> int:
+    """Pure-Python distance used when rapidfuzz is not installed."""
     if len(s1) < len(s2):
-        return calculate_levenshtein_distance(s2, s1)
+        s1, s2 = s2, s1
+    return _myers_distance(s2, s1, max_distance)
+
+
+def _myers_distance(pattern: Sequence, text: Sequence, max_distance: Optional[int] = None) -> int:
+    """
+    Myers/Hyyro bit-parallel Levenshtein distance.
+    Each DP column is encoded as vertical +1/-1 delta bitmasks, so one
+    pass of integer ops per text element replaces a full row of the DP.
+    Python ints are arbitrary precision, so the bit vectors simply grow with
+    the pattern instead of being split into 64-bit blocks.
+    """
+    m = len(pattern)
+    if m == 0:
+        return len(text) if max_distance is None else min(len(text), max_distance + 1)
+
+    if max_distance is not None and abs(m - len(text)) > max_distance:
+        return max_distance + 1
+
+    peq = {}
+    for i, c in enumerate(pattern):
+        peq[c] = peq.get(c, 0) | (1 << i)
+
+    mask = (1 << m) - 1
+    last = 1 << (m - 1)
+    vp = mask
+    vn = 0
+    score = m
 
-    if len(s2) == 0:
-        return len(s1)
+    remaining = len(text)
+    for c in text:
+        remaining -= 1
+        eq = peq.get(c, 0)
+        d0 = (((eq & vp) + vp) ^ vp) | eq | vn
+        hp = vn | (~(d0 | vp) & mask)
+        hn = d0 & vp
 
-    previous_row = range(len(s2) + 1)
-    for i, c1 in enumerate(s1):
-        current_row = [i + 1]
-        for j, c2 in enumerate(s2):
-            insertions = previous_row[j + 1] + 1
-            deletions = current_row[j] + 1
-            substitutions = previous_row[j] + (c1 != c2)
-            current_row.append(min(insertions, deletions, substitutions))
-        previous_row = current_row
+        if hp & last:
+            score += 1
+        elif hn & last:
+            score -= 1
 
-    return previous_row[-1]
+        hp = ((hp << 1) | 1) & mask
+        hn = (hn << 1) & mask
+        vp = hn | (~(d0 | hp) & mask)
+        vn = hp & d0
+
+        # Each remaining column can lower the score by at most one.
+        if max_distance is not None and score - remaining > max_distance:
+            return max_distance + 1
+
+    return score
 
 
 def normalize_text(text: str) -> str:
@@ -31,6 +85,71 @@ def normalize_text(text: str) -> str:
     return text
 
 
+def _word_edit_distance(gt_words: List[str], pred_words: List[str]) -> int:
+    """Edit distance over word tokens instead of characters."""
+    if Levenshtein is not None:
+        return Levenshtein.distance(gt_words, pred_words)
+    return _levenshtein_fallback(gt_words, pred_words)
+
+
+def _distances_to_all(reference: Sequence, candidates: List[Sequence]) -> List[int]:
+    """Edit distance from one reference to every candidate; a single cdist call with rapidfuzz."""
+    if not candidates:
+        return []
+    if process is not None:
+        return process.cdist([reference], candidates, scorer=Levenshtein.distance)[0].tolist()
+    return [_levenshtein_fallback(reference, candidate) for candidate in candidates]
+
+
+def _pairwise_distances(references: List[Sequence], candidates: List[Sequence]) -> List[int]:
+    """Edit distance of each reference to the candidate at the same index; a single cpdist call with rapidfuzz."""
+    if not references:
+        return []
+    if process is not None:
+        return process.cpdist(references, candidates, scorer=Levenshtein.distance).tolist()
+    return [_levenshtein_fallback(reference, candidate) for reference, candidate in zip(references, candidates)]
+
+
+def _error_rate(distance: int, reference_length: int, predicted_length: int) -> float:
+    if not reference_length:
+        return 0.0 if not predicted_length else 1.0
+    return min(distance / reference_length, 1.0)
+
+
+def _accuracy_from_error_rate(error_rate: float) -> float:
+    return max(0.0, (1.0 - error_rate) * 100)
+
+
+def _word_accuracy(gt_words: List[str], pred_words: List[str]) -> float:
+    if not gt_words:
+        return 100.0 if not pred_words else 0.0
+
+    correct_words = sum(1 for gt, pred in zip(gt_words, pred_words) if gt == pred)
+    return (correct_words / len(gt_words)) * 100
+
+
+def _metrics_core(ground_truth: str, predicted: str,
+                  char_distance: Optional[int] = None, word_distance: Optional[int] = None) -> Dict:
+    """Compute every metric from a single character and a single word edit distance."""
+    if char_distance is None:
+        char_distance = calculate_levenshtein_distance(ground_truth, predicted)
+    cer = _error_rate(char_distance, len(ground_truth), len(predicted))
+
+    gt_words = normalize_text(ground_truth).split()
+    pred_words = normalize_text(predicted).split()
+    if word_distance is None:
+        word_distance = _word_edit_distance(gt_words, pred_words) if gt_words else 0
+    wer = _error_rate(word_distance, len(gt_words), len(pred_words))
+
+    return {
+        'levenshtein': char_distance,
+        'cer': cer,
+        'wer': wer,
+        'accuracy': _accuracy_from_error_rate(cer),
+        'word_accuracy': _word_accuracy(gt_words, pred_words)
+    }
+
+
 def calculate_cer(ground_truth: str, predicted: str) -> float:
     """
     Calculate Character Error Rate (CER).
@@ -41,8 +160,7 @@ def calculate_cer(ground_truth: str, predicted: str) -> float:
         return 0.0 if not predicted else 1.0
 
     distance = calculate_levenshtein_distance(ground_truth, predicted)
-    cer = distance / len(ground_truth)
-    return min(cer, 1.0)
+    return _error_rate(distance, len(ground_truth), len(predicted))
 
 
 def calculate_wer(ground_truth: str, predicted: str) -> float:
@@ -57,27 +175,8 @@ def calculate_wer(ground_truth: str, predicted: str) -> float:
     if not gt_words:
         return 0.0 if not pred_words else 1.0
 
-    distance = calculate_levenshtein_distance(' '.join(gt_words), ' '.join(pred_words))
-    word_distance = 0
-
-    m, n = len(gt_words), len(pred_words)
-    dp = [[0] * (n + 1) for _ in range(m + 1)]
-
-    for i in range(m + 1):
-        dp[i][0] = i
-    for j in range(n + 1):
-        dp[0][j] = j
-
-    for i in range(1, m + 1):
-        for j in range(1, n + 1):
-            if gt_words[i-1] == pred_words[j-1]:
-                dp[i][j] = dp[i-1][j-1]
-            else:
-                dp[i][j] = 1 + min(dp[i-1][j], dp[i][j-1], dp[i-1][j-1])
-
-    word_distance = dp[m][n]
-    wer = word_distance / len(gt_words)
-    return min(wer, 1.0)
+    word_distance = _word_edit_distance(gt_words, pred_words)
+    return _error_rate(word_distance, len(gt_words), len(pred_words))
 
 
 def calculate_accuracy(ground_truth: str, predicted: str) -> float:
@@ -85,12 +184,7 @@ def calculate_accuracy(ground_truth: str, predicted: str) -> float:
     Calculate accuracy as percentage of correct characters.
     Returns value between 0 and 100.
     """
-    if not ground_truth:
-        return 100.0 if not predicted else 0.0
-
-    cer = calculate_cer(ground_truth, predicted)
-    accuracy = max(0.0, (1.0 - cer) * 100)
-    return accuracy
+    return _accuracy_from_error_rate(calculate_cer(ground_truth, predicted))
 
 
 def calculate_word_accuracy(ground_truth: str, predicted: str) -> float:
@@ -100,13 +194,7 @@ def calculate_word_accuracy(ground_truth: str, predicted: str) -> float:
     """
     gt_words = normalize_text(ground_truth).split()
     pred_words = normalize_text(predicted).split()
-
-    if not gt_words:
-        return 100.0 if not pred_words else 0.0
-
-    correct_words = sum(1 for gt, pred in zip(gt_words, pred_words) if gt == pred)
-    word_accuracy = (correct_words / len(gt_words)) * 100
-    return word_accuracy
+    return _word_accuracy(gt_words, pred_words)
 
 
 def get_detailed_metrics(ground_truth: str, predicted: str) -> Dict:
@@ -120,18 +208,37 @@ def get_detailed_metrics(ground_truth: str, predicted: str) -> Dict:
     Returns:
         Dictionary containing all metrics
     """
-    cer = calculate_cer(ground_truth, predicted)
-    wer = calculate_wer(ground_truth, predicted)
-    accuracy = calculate_accuracy(ground_truth, predicted)
-    word_accuracy = calculate_word_accuracy(ground_truth, predicted)
-    levenshtein = calculate_levenshtein_distance(ground_truth, predicted)
+    return _format_metrics(ground_truth, predicted, _metrics_core(ground_truth, predicted))
+
+
+def get_detailed_metrics_batch(pairs: List[Tuple[str, str]]) -> List[Dict]:
+    """
+    Calculate get_detailed_metrics for many (ground_truth, predicted) pairs.
+    Character and word distances for the whole batch are each computed in one call.
+    """
+    ground_truths = [ground_truth for ground_truth, _ in pairs]
+    predictions = [predicted for _, predicted in pairs]
+
+    char_distances = _pairwise_distances(ground_truths, predictions)
+    gt_word_lists = [normalize_text(ground_truth).split() for ground_truth in ground_truths]
+    pred_word_lists = [normalize_text(predicted).split() for predicted in predictions]
+    word_distances = _pairwise_distances(gt_word_lists, pred_word_lists)
 
+    return [
+        _format_metrics(ground_truth, predicted,
+                        _metrics_core(ground_truth, predicted, char_distance, word_distance if gt_words else 0))
+        for ground_truth, predicted, char_distance, word_distance, gt_words
+        in zip(ground_truths, predictions, char_distances, word_distances, gt_word_lists)
+    ]
+
+
+def _format_metrics(ground_truth: str, predicted: str, core: Dict) -> Dict:
     return {
-        'character_error_rate': round(cer * 100, 2),
-        'word_error_rate': round(wer * 100, 2),
-        'character_accuracy': round(accuracy, 2),
-        'word_accuracy': round(word_accuracy, 2),
-        'levenshtein_distance': levenshtein,
+        'character_error_rate': round(core['cer'] * 100, 2),
+        'word_error_rate': round(core['wer'] * 100, 2),
+        'character_accuracy': round(core['accuracy'], 2),
+        'word_accuracy': round(core['word_accuracy'], 2),
+        'levenshtein_distance': core['levenshtein'],
         'ground_truth_length': len(ground_truth),
         'predicted_length': len(predicted),
         'ground_truth_word_count': len(ground_truth.split()),
@@ -151,13 +258,27 @@ def compare_engines(ground_truth: str, engine_results: List[Dict]) -> List[Dict]
     Returns:
         List of results with accuracy metrics added
     """
-    results_with_metrics = []
+    scored = [r for r in engine_results if r.get('success', True) and 'text' in r]
+    predictions = [r['text'] for r in scored]
 
+    # Struct-of-arrays: all character and word distances in one batch each.
+    char_distances = _distances_to_all(ground_truth, predictions)
+    gt_words = normalize_text(ground_truth).split()
+    if gt_words:
+        word_distances = _distances_to_all(gt_words, [normalize_text(p).split() for p in predictions])
+    else:
+        word_distances = [0] * len(predictions)
+
+    metrics_by_result = {}
+    for result, char_distance, word_distance in zip(scored, char_distances, word_distances):
+        core = _metrics_core(ground_truth, result['text'], char_distance, word_distance)
+        metrics_by_result[id(result)] = _format_metrics(ground_truth, result['text'], core)
+
+    results_with_metrics = []
     for result in engine_results:
-        if result.get('success', True) and 'text' in result:
-            metrics = get_detailed_metrics(ground_truth, result['text'])
+        if id(result) in metrics_by_result:
             result_copy = result.copy()
-            result_copy['accuracy_metrics'] = metrics
+            result_copy['accuracy_metrics'] = metrics_by_result[id(result)]
             results_with_metrics.append(result_copy)
         else:
             results_with_metrics.append(result)
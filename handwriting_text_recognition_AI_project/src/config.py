@@ -1,5 +1,9 @@
+import os
+from pathlib import Path
+
 MODEL_NAME = "microsoft/trocr-large-handwritten"
 MAX_NEW_TOKENS = 100
+MAX_BATCH_SIZE = 16
 MAX_IMAGE_DIMENSION = 768
 WINDOW_TITLE = "Handwritten Text Recognition"
 WINDOW_WIDTH = 1080
@@ -10,3 +14,8 @@ DEFAULT_THEME = "dark"
 COLOR_THEME = "blue"
 SUPPORTED_FORMATS = ['.jpg', '.jpeg', '.png', '.bmp', '.gif', '.tiff', '.webp']
 MAX_IMAGE_SIZE_MB = 10
+TEXT_CACHE_DIR = str(Path.home() / ".cache" / "trocr_results")
+TEXT_CACHE_SIZE_LIMIT = 2 ** 30
+COMPILE_CACHE_DIR = str(Path.home() / ".cache" / "trocr_inductor")
+# Weight precision override: "int8" (CPU only), "fp16" or "bf16"; empty picks per device.
+QUANTIZE = os.environ.get("QUANTIZE", "").lower()
@@ -0,0 +1,138 @@
+import os
+import threading
+from collections import OrderedDict
+from io import BytesIO
+from typing import Optional, Union
+from PIL import Image
+import requests
+from requests.adapters import HTTPAdapter
+from .config import MAX_IMAGE_SIZE_MB, MAX_IMAGE_DIMENSION
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+IMAGE_CACHE_BYTES = 256 * 1024 * 1024
+
+# (input, file version, draft size) -> decoded image, least recently used first.
+_image_cache = OrderedDict()
+_image_cache_lock = threading.Lock()
+_image_cache_bytes = 0
+
+# Keep-alive session so repeated URL loads reuse TCP/TLS connections.
+_SESSION = requests.Session()
+_SESSION.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+
+def is_url(image_input: str) -> bool:
+    return image_input.startswith(('http://', 'https://'))
+
+
+def _open_rgb(source, draft_size: Optional[int] = None) -> Image.Image:
+    image = Image.open(source)
+    if draft_size:
+        # JPEG only: let the decoder downscale by 1/2, 1/4 or 1/8 while staying >= draft_size.
+        image.draft('RGB', (draft_size, draft_size))
+    if image.mode != 'RGB':
+        return image.convert('RGB')
+    image.load()
+    return image
+
+
+def _fetch_url(url: str, draft_size: Optional[int]) -> Image.Image:
+    max_bytes = MAX_IMAGE_SIZE_MB * 1024 * 1024
+
+    with _SESSION.get(url, timeout=10, stream=True) as response:
+        response.raise_for_status()
+
+        content_length = response.headers.get('content-length')
+        if content_length:
+            size_mb = int(content_length) / (1024 * 1024)
+            if size_mb > MAX_IMAGE_SIZE_MB:
+                raise ValueError(
+                    f"Image too large: {size_mb:.2f}MB. "
+                    f"Maximum allowed: {MAX_IMAGE_SIZE_MB}MB"
+                )
+
+        # content-length is often missing or wrong, so enforce the limit while reading.
+        buffer = BytesIO()
+        for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+            buffer.write(chunk)
+            if buffer.tell() > max_bytes:
+                raise ValueError(f"Image too large. Maximum allowed: {MAX_IMAGE_SIZE_MB}MB")
+
+    buffer.seek(0)
+    return _open_rgb(buffer, draft_size)
+
+
+def _decoded_size(image: Image.Image) -> int:
+    width, height = image.size
+    return width * height * len(image.getbands())
+
+
+def _load_cached(image_input: str, file_stamp: Optional[tuple], draft_size: Optional[int]) -> Image.Image:
+    global _image_cache_bytes
+    key = (image_input, file_stamp, draft_size)
+    with _image_cache_lock:
+        image = _image_cache.get(key)
+        if image is not None:
+            _image_cache.move_to_end(key)
+            return image
+
+    if is_url(image_input):
+        image = _fetch_url(image_input, draft_size)
+    else:
+        image = _open_rgb(image_input, draft_size)
+
+    # Full-resolution decodes can be hundreds of MB, so the cache is bounded by
+    # decoded size rather than entry count; anything over the budget is not kept.
+    size = _decoded_size(image)
+    if size <= IMAGE_CACHE_BYTES:
+        with _image_cache_lock:
+            if key not in _image_cache:
+                _image_cache[key] = image
+                _image_cache_bytes += size
+            while _image_cache_bytes > IMAGE_CACHE_BYTES:
+                _, evicted = _image_cache.popitem(last=False)
+                _image_cache_bytes -= _decoded_size(evicted)
+    return image
+
+
+def load_image(image_input: Union[str, bytes, Image.Image], draft_size: Optional[int] = None) -> Image.Image:
+    """
+    Load a path, URL or raw encoded bytes as an RGB image, or pass an already decoded image through.
+    Paths and URLs are cached per input so several engines share one download and decode;
+    those images are shared, so callers must not modify them in place.
+    """
+    if isinstance(image_input, Image.Image):
+        return image_input if image_input.mode == 'RGB' else image_input.convert('RGB')
+
+    try:
+        if isinstance(image_input, (bytes, bytearray)):
+            # Uploaded file contents: decoded straight from memory and never cached.
+            return _open_rgb(BytesIO(image_input), draft_size)
+
+        file_stamp = None
+        if not is_url(image_input):
+            # Uploads are saved under reused filenames, so the key includes the file version.
+            stat = os.stat(image_input)
+            file_stamp = (stat.st_mtime_ns, stat.st_size)
+        return _load_cached(image_input, file_stamp, draft_size)
+    except requests.RequestException as e:
+        raise ValueError(f"Failed to load image from URL: {str(e)}")
+    except Exception as e:
+        raise ValueError(f"Failed to load image: {str(e)}")
+
+
+def resize_for_model(image: Image.Image, max_dimension: int = MAX_IMAGE_DIMENSION) -> Image.Image:
+    width, height = image.size
+
+    if width > max_dimension or height > max_dimension:
+        if width > height:
+            new_width = max_dimension
+            new_height = int((max_dimension / width) * height)
+        else:
+            new_height = max_dimension
+            new_width = int((max_dimension / height) * width)
+
+        image = image.resize((new_width, new_height), Image.Resampling.BILINEAR)
+
+    return image
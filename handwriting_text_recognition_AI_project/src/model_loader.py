@@ -1,7 +1,9 @@
+import os
 from typing import Optional, Tuple
 import torch
+from torchvision.transforms import v2
 from transformers import TrOCRProcessor, VisionEncoderDecoderModel
-from config import MODEL_NAME
+from .config import MODEL_NAME, COMPILE_CACHE_DIR, QUANTIZE
 
 
 def get_device():
@@ -13,11 +15,46 @@ def get_device():
         return torch.device("cpu")
 
 
+def get_dtype(device: torch.device, quantize: str = QUANTIZE) -> torch.dtype:
+    if quantize == "bf16":
+        return torch.bfloat16
+    elif quantize == "fp16":
+        return torch.float16
+    elif quantize not in ("", "int8"):
+        raise ValueError(f"Unsupported QUANTIZE value: {quantize}. Use int8, fp16 or bf16")
+
+    if device.type == "cuda":
+        return torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+    elif device.type == "mps":
+        return torch.float16
+    else:
+        return torch.float32
+
+
+def get_precision(device: torch.device, quantize: str = QUANTIZE) -> str:
+    """Effective weight precision on this device, e.g. "int8" or "torch.bfloat16"."""
+    if quantize == "int8" and device.type == "cpu":
+        return "int8"
+    return str(get_dtype(device, quantize))
+
+
+def build_transform(processor: TrOCRProcessor) -> v2.Compose:
+    """Tensor equivalent of the processor's resize + rescale + normalize, runnable on the GPU."""
+    image_processor = processor.image_processor
+    size = (image_processor.size["height"], image_processor.size["width"])
+    return v2.Compose([
+        v2.Resize(size, antialias=True),
+        v2.ToDtype(torch.float32, scale=True),
+        v2.Normalize(mean=image_processor.image_mean, std=image_processor.image_std),
+    ])
+
+
 class ModelLoader:
 
     def __init__(self):
         self._model: Optional[VisionEncoderDecoderModel] = None
         self._processor: Optional[TrOCRProcessor] = None
+        self._transform: Optional[v2.Compose] = None
         self._device = None
 
     def load(self) -> Tuple[VisionEncoderDecoderModel, TrOCRProcessor]:
@@ -26,7 +63,8 @@ class ModelLoader:
                 self._device = get_device()
 
                 print(f"Loading model: {MODEL_NAME}")
-                print(f"Using device: {self._device}")
+                dtype = get_dtype(self._device)
+                print(f"Using device: {self._device} ({dtype})")
 
                 if self._device.type == "mps":
                     print("🚀 Apple Silicon GPU detected - expect 10-20x speedup!")
@@ -38,14 +76,34 @@ class ModelLoader:
                 print("Loading... (may take a minute on first run)")
 
                 self._processor = TrOCRProcessor.from_pretrained(MODEL_NAME)
+                self._transform = build_transform(self._processor)
 
                 self._model = VisionEncoderDecoderModel.from_pretrained(
                     MODEL_NAME,
                     low_cpu_mem_usage=True,
-                    torch_dtype=torch.float32
+                    torch_dtype=dtype
                 )
 
                 self._model = self._model.to(self._device)
+                self._model.eval()
+
+                if QUANTIZE == "int8":
+                    if self._device.type == "cpu":
+                        # Dynamic quantization: int8 Linear weights, activations quantized per batch.
+                        self._model = torch.ao.quantization.quantize_dynamic(
+                            self._model, {torch.nn.Linear}, dtype=torch.qint8
+                        )
+                        print("Quantized linear layers to int8")
+                    else:
+                        print(f"⚠️  int8 quantization is CPU only - keeping {dtype} on {self._device}")
+
+                if self._device.type == "cuda":
+                    # Keep Inductor's compiled kernels across restarts; an explicit
+                    # TORCHINDUCTOR_CACHE_DIR from the environment still wins.
+                    os.environ.setdefault("TORCHINDUCTOR_CACHE_DIR", COMPILE_CACHE_DIR)
+                    # The encoder always sees fixed-size 384x384 inputs, so it compiles
+                    # into stable CUDA graphs; the decoder's growing sequence would not.
+                    self._model.encoder.compile(mode="reduce-overhead", fullgraph=False)
 
                 print(f"✅ Model loaded successfully on {self._device}!")
 
@@ -54,6 +112,11 @@ class ModelLoader:
 
         return self._model, self._processor
 
+    def get_transform(self) -> v2.Compose:
+        if self._transform is None:
+            self.load()
+        return self._transform
+
     def get_device(self):
         return self._device if self._device else get_device()
 
@@ -1,21 +1,32 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Union
 from PIL import Image
-import requests
-from io import BytesIO
-from smart_correction import smart_correct
+from .image_io import load_image
+from .smart_correction import smart_correct
 
+_easyocr_reader_lock = threading.Lock()
 
-def load_image_from_input(image_input: str) -> Image.Image:
-    if image_input.startswith(('http://', 'https://')):
-        response = requests.get(image_input, timeout=10)
-        response.raise_for_status()
-        return Image.open(BytesIO(response.content)).convert("RGB")
-    else:
-        return Image.open(image_input).convert("RGB")
 
+@lru_cache(maxsize=1)
+def _create_easyocr_reader():
+    import easyocr
+    import torch
 
-def ocr_trocr(image_input: str) -> dict:
+    use_gpu = torch.cuda.is_available() or torch.backends.mps.is_available()
+    return easyocr.Reader(['en'], gpu=use_gpu)
+
+
+def _get_easyocr_reader():
+    # lru_cache alone does not stop two threads from building the reader at once.
+    with _easyocr_reader_lock:
+        return _create_easyocr_reader()
+
+
+def ocr_trocr(image_input: Union[str, Image.Image]) -> dict:
     try:
-        from text_recognizer import recognize_text
+        from .text_recognizer import recognize_text
         import time
         start = time.time()
         text = recognize_text(image_input)
@@ -41,20 +52,17 @@ def ocr_trocr(image_input: str) -> dict:
         }
 
 
-def ocr_easyocr(image_input: str) -> dict:
+def ocr_easyocr(image_input: Union[str, Image.Image]) -> dict:
     try:
-        import easyocr
         import time
-        import torch
-
-        if not hasattr(ocr_easyocr, 'reader'):
-            use_gpu = torch.cuda.is_available() or torch.backends.mps.is_available()
-            ocr_easyocr.reader = easyocr.Reader(['en'], gpu=use_gpu)
+        import numpy as np
 
-        image = load_image_from_input(image_input)
+        reader = _get_easyocr_reader()
+        image = load_image(image_input)
 
         start = time.time()
-        results = ocr_easyocr.reader.readtext(image, detail=0)
+        # readtext only accepts paths, bytes, arrays and JPEG-backed PIL images.
+        results = reader.readtext(np.asarray(image), detail=0)
         text = ' '.join(results)
         elapsed = time.time() - start
 
@@ -78,12 +86,12 @@ def ocr_easyocr(image_input: str) -> dict:
         }
 
 
-def ocr_tesseract(image_input: str) -> dict:
+def ocr_tesseract(image_input: Union[str, Image.Image]) -> dict:
     try:
         import pytesseract
         import time
 
-        image = load_image_from_input(image_input)
+        image = load_image(image_input)
 
         start = time.time()
         text = pytesseract.image_to_string(image).strip()
@@ -105,16 +113,41 @@ def ocr_tesseract(image_input: str) -> dict:
         }
 
 
-def recognize_multi(image_input: str, engines=['trocr', 'easyocr']) -> list:
-    results = []
-
-    if 'trocr' in engines:
-        results.append(ocr_trocr(image_input))
-
-    if 'easyocr' in engines:
-        results.append(ocr_easyocr(image_input))
-
-    if 'tesseract' in engines:
-        results.append(ocr_tesseract(image_input))
-
-    return results
+def recognize_multi(image_input: Union[str, Image.Image], engines=['trocr', 'easyocr']) -> list:
+    runners = [
+        (label, fn)
+        for name, label, fn in (
+            ('trocr', 'TrOCR (AI)', ocr_trocr),
+            ('easyocr', 'EasyOCR', ocr_easyocr),
+            ('tesseract', 'Tesseract', ocr_tesseract),
+        )
+        if name in engines
+    ]
+    if not runners:
+        return []
+
+    if isinstance(image_input, str):
+        # recognize_text skips validation for decoded images, so check format and size here.
+        from .text_recognizer import validate_image_input
+        try:
+            validate_image_input(image_input)
+        except ValueError as e:
+            # Report it the way each engine reports its own failures.
+            return [
+                {'engine': label, 'text': '', 'error': str(e), 'success': False}
+                for label, _ in runners
+            ]
+
+    # Download and decode once; every engine gets the same PIL image.
+    try:
+        shared_image = load_image(image_input)
+    except Exception:
+        shared_image = image_input  # each engine reports the load error in its own result
+
+    # TrOCR waits on the GPU, Tesseract on a subprocess, EasyOCR mostly in native code.
+    with ThreadPoolExecutor(max_workers=len(runners)) as executor:
+        futures = [
+            executor.submit(fn, shared_image)
+            for _, fn in runners
+        ]
+        return [future.result() for future in futures]
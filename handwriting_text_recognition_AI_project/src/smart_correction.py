@@ -1,4 +1,6 @@
 import re
+from collections import namedtuple
+from functools import lru_cache
 
 PATTERN_RM = re.compile(r'\b([A-Z])rm([a-zA-Z]+)\b')
 PATTERN_RM_UPPER = re.compile(r'rm(?=[A-Z])')
@@ -11,6 +13,20 @@ PATTERN_NN_BETWEEN = re.compile(r'(?<=[A-Z])nn(?=[A-Z])')
 PATTERN_NN_STANDALONE = re.compile(r'\bnn\b')
 PATTERN_SHORT_WORDS = re.compile(r'\b([A-Z]{1,3})([a-z]{1,3})\b')
 
+# Applied one after another: the lookbehind rules must see the M written by an
+# earlier rule (e.g. 'xArmrn ' -> 'xAMrn ' -> 'xAMM '). Each pass is skipped when
+# its literal substring is absent, which no match can do without.
+M_REPLACEMENTS = [
+    ('rm', PATTERN_RM_UPPER, 'M'),
+    ('rm', PATTERN_RM_AFTER, 'M'),
+    ('rm', PATTERN_RM_STANDALONE, 'M'),
+    ('Rn', PATTERN_RN_STANDALONE, 'M'),
+    ('rn', PATTERN_RN_BETWEEN, 'M'),
+    ('rn', PATTERN_RN_END, 'M'),
+    ('nn', PATTERN_NN_BETWEEN, 'M'),
+    ('nn', PATTERN_NN_STANDALONE, 'm'),
+]
+
 CHAR_REPLACEMENTS = [
     (re.compile(r'\b0(?=[A-Z])'), 'O'),
     (re.compile(r'(?<=[A-Z])0(?=[A-Z])'), 'O'),
@@ -23,33 +39,67 @@ CHAR_REPLACEMENTS = [
     (re.compile(r'(?<=[A-Z])8\b'), 'B'),
     (re.compile(r'\bl(?=[A-Z])'), 'I'),
     (re.compile(r'(?<=[A-Z])l\b'), 'I'),
+]
+
+# Applied one after another: each rule must see the W produced by the one before
+# it (e.g. 'vvv' -> 'Wv' -> 'WY'), which a single combined scan would not.
+V_REPLACEMENTS = [
     (re.compile(r'\bvv'), 'W'),
     (re.compile(r'(?<=[A-Z])vv'), 'W'),
     (re.compile(r'(?<=[A-Z])v\b'), 'Y'),
 ]
 
+# Single-scan version of CHAR_REPLACEMENTS, dispatching on the matching group.
+PATTERN_CHAR_COMBINED = re.compile(
+    '|'.join(f'(?P<c{i}>{pattern.pattern})' for i, (pattern, _) in enumerate(CHAR_REPLACEMENTS))
+)
+CHAR_REPLACEMENT_MAP = {f'c{i}': replacement for i, (_, replacement) in enumerate(CHAR_REPLACEMENTS)}
+
+# Every pattern above needs at least one of these substrings to match
+# (short-word capitalization fires on any uppercase-lowercase pair).
+PATTERN_TRIGGER = re.compile(r'r[mn]|Rn|nn|[A-Z][a-z]|[0158lv]')
+
+# Immutable so cached results can be shared between callers.
+CorrectionResult = namedtuple('CorrectionResult', ['corrected', 'corrections'])
+
 def correct_common_mistakes(text: str) -> dict:
-    original = text
+    if not PATTERN_TRIGGER.search(text):
+        return {
+            'original': text,
+            'corrected': text,
+            'changed': False,
+            'corrections': []
+        }
+
+    corrected, corrections = _correct_common_mistakes_cached(text)
+
+    return {
+        'original': text,
+        'corrected': corrected,
+        'changed': text != corrected,
+        'corrections': list(corrections)
+    }
+
+
+@lru_cache(maxsize=2048)
+def _correct_common_mistakes_cached(text: str) -> CorrectionResult:
     corrections = []
     corrected = text
 
-    matches = list(PATTERN_RM.finditer(corrected))
-    for match in reversed(matches):
-        original_word = match.group(0)
-        fixed_word = match.group(1) + 'M' + match.group(2).upper()
-        corrected = corrected[:match.start()] + fixed_word + corrected[match.end():]
-        corrections.append(f"'{original_word}' → '{fixed_word}'")
-
-    corrected = PATTERN_RM_UPPER.sub('M', corrected)
-    corrected = PATTERN_RM_AFTER.sub('M', corrected)
-    corrected = PATTERN_RM_STANDALONE.sub('M', corrected)
+    if 'rm' in corrected:
+        word_fixes = []
 
-    corrected = PATTERN_RN_STANDALONE.sub('M', corrected)
-    corrected = PATTERN_RN_BETWEEN.sub('M', corrected)
-    corrected = PATTERN_RN_END.sub('M', corrected)
+        def fix_rm_word(match):
+            fixed_word = match.group(1) + 'M' + match.group(2).upper()
+            word_fixes.append(f"'{match.group(0)}' → '{fixed_word}'")
+            return fixed_word
+        corrected = PATTERN_RM.sub(fix_rm_word, corrected)
+        # Reported last word first, as the original right-to-left rewrite did.
+        corrections.extend(reversed(word_fixes))
 
-    corrected = PATTERN_NN_BETWEEN.sub('M', corrected)
-    corrected = PATTERN_NN_STANDALONE.sub('m', corrected)
+    for trigger, pattern, replacement in M_REPLACEMENTS:
+        if trigger in corrected:
+            corrected = pattern.sub(replacement, corrected)
 
     def uppercase_short_words(match):
         word = match.group(0)
@@ -61,18 +111,21 @@ def correct_common_mistakes(text: str) -> dict:
     if before != corrected:
         corrections.append(f"Fixed capitalization in short words")
 
-    for pattern, replacement in CHAR_REPLACEMENTS:
-        before = corrected
-        corrected = pattern.sub(replacement, corrected)
-        if before != corrected:
-            corrections.append(f"Fixed character confusion")
+    fired = set()
 
-    return {
-        'original': original,
-        'corrected': corrected,
-        'changed': original != corrected,
-        'corrections': corrections
-    }
+    def replace_char(match):
+        fired.add(match.lastgroup)
+        return CHAR_REPLACEMENT_MAP[match.lastgroup]
+    corrected = PATTERN_CHAR_COMBINED.sub(replace_char, corrected)
+    corrections.extend(f"Fixed character confusion" for _ in fired)
+
+    if 'v' in corrected:
+        for pattern, replacement in V_REPLACEMENTS:
+            corrected, count = pattern.subn(replacement, corrected)
+            if count:
+                corrections.append(f"Fixed character confusion")
+
+    return CorrectionResult(corrected, tuple(corrections))
 
 
 def smart_correct(text: str) -> dict:
@@ -1,23 +1,36 @@
 import os
 from pathlib import Path
-from typing import Union
+from typing import List, Union
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image
-import requests
-import hashlib
-from functools import lru_cache
-from io import BytesIO
-from model_loader import model_loader
-from config import MAX_NEW_TOKENS, SUPPORTED_FORMATS, MAX_IMAGE_SIZE_MB, MAX_IMAGE_DIMENSION
-from smart_correction import smart_correct
-
-_text_cache = {}
+import torch
+from torchvision.transforms.v2.functional import pil_to_tensor
+import xxhash
+from diskcache import Cache
+from . import image_io
+from .image_io import is_url, resize_for_model
+from .model_loader import model_loader, get_precision
+from .config import (
+    MODEL_NAME, MAX_NEW_TOKENS, MAX_BATCH_SIZE, SUPPORTED_FORMATS, MAX_IMAGE_SIZE_MB, MAX_IMAGE_DIMENSION,
+    TEXT_CACHE_DIR, TEXT_CACHE_SIZE_LIMIT
+)
+from .smart_correction import smart_correct
+
+# Raw model output keyed by (model, precision, image hash); persists across restarts and
+# is shared between worker processes. Corrections are reapplied on read.
+_text_cache = Cache(TEXT_CACHE_DIR, size_limit=TEXT_CACHE_SIZE_LIMIT)
+
+# Every model call runs on this one thread. The CUDA encoder is compiled with
+# reduce-overhead, and its CUDA graphs are recorded and replayed per thread, so
+# warmup, web requests and recognize_multi workers must all drive it from here.
+_inference_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="trocr-inference")
 
 
 def validate_image_input(image_input: str) -> None:
     if not image_input or not isinstance(image_input, str):
         raise ValueError("Image input must be a non-empty string")
 
-    if image_input.startswith(('http://', 'https://')):
+    if is_url(image_input):
         return
 
     if not os.path.isfile(image_input):
@@ -50,82 +63,100 @@ def preprocess_image(image: Image.Image, enable_preprocessing: bool = False) ->
     return enhanced
 
 
-def load_image(image_input: str) -> Image.Image:
-    try:
-        if image_input.startswith(('http://', 'https://')):
-            response = requests.get(image_input, timeout=10)
-            response.raise_for_status()
-
-            content_length = response.headers.get('content-length')
-            if content_length:
-                size_mb = int(content_length) / (1024 * 1024)
-                if size_mb > MAX_IMAGE_SIZE_MB:
-                    raise ValueError(
-                        f"Image too large: {size_mb:.2f}MB. "
-                        f"Maximum allowed: {MAX_IMAGE_SIZE_MB}MB"
-                    )
-
-            image = Image.open(BytesIO(response.content)).convert("RGB")
-        else:
-            image = Image.open(image_input).convert("RGB")
-
-        width, height = image.size
-
-        if width > MAX_IMAGE_DIMENSION or height > MAX_IMAGE_DIMENSION:
-            if width > height:
-                new_width = MAX_IMAGE_DIMENSION
-                new_height = int((MAX_IMAGE_DIMENSION / width) * height)
-            else:
-                new_height = MAX_IMAGE_DIMENSION
-                new_width = int((MAX_IMAGE_DIMENSION / height) * width)
-
-            image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+def load_image(image_input: Union[str, bytes, Image.Image]) -> Image.Image:
+    image = image_io.load_image(image_input, draft_size=MAX_IMAGE_DIMENSION)
+    return resize_for_model(image)
 
-        return image
-    except requests.RequestException as e:
-        raise ValueError(f"Failed to load image from URL: {str(e)}")
-    except Exception as e:
-        raise ValueError(f"Failed to load image: {str(e)}")
 
+def _get_image_hash(image: Image.Image) -> int:
+    # Hash every pixel: the persistent cache must not confuse two near-identical
+    # handwriting images, which a downsampled thumbnail could. Mode and size are
+    # mixed in so equal buffers with different shapes do not collide.
+    hasher = xxhash.xxh3_64(f"{image.mode}:{image.size}".encode())
+    hasher.update(image.tobytes())
+    return hasher.intdigest()
 
-def _get_image_hash(image: Image.Image) -> str:
-    img_bytes = image.tobytes()
-    return hashlib.md5(img_bytes).hexdigest()
 
+def _cache_key(image: Image.Image) -> tuple:
+    # Output differs between precisions, so int8/fp16/bf16/fp32 results are kept apart.
+    return (MODEL_NAME, get_precision(model_loader.get_device()), _get_image_hash(image))
 
-def recognize_text(image_input: str) -> str:
-    validate_image_input(image_input)
 
-    image = load_image(image_input)
+def _generate_text(images: List[Image.Image]) -> List[str]:
+    return _inference_executor.submit(_run_model, images).result()
 
-    image_hash = _get_image_hash(image)
-    if image_hash in _text_cache:
-        return _text_cache[image_hash]
 
+def _run_model(images: List[Image.Image]) -> List[str]:
     try:
         model, processor = model_loader.load()
     except Exception as e:
         raise Exception(f"Model loading failed: {str(e)}")
 
     try:
-        pixel_values = processor(images=image, return_tensors="pt").pixel_values
-
         device = model_loader.get_device()
-        pixel_values = pixel_values.to(device)
+        transform = model_loader.get_transform()
 
-        generated_ids = model.generate(pixel_values, max_new_tokens=MAX_NEW_TOKENS)
-        generated_text = processor.batch_decode(generated_ids, skip_special_tokens=True)[0]
+        # Resize/normalize on CUDA; antialiased resize is not reliably supported on MPS.
+        transform_device = device if device.type == "cuda" else torch.device("cpu")
+        pixel_values = torch.stack([
+            transform(pil_to_tensor(image).to(transform_device, non_blocking=True))
+            for image in images
+        ])
+        pixel_values = pixel_values.to(device, dtype=model.dtype)
 
-        raw_text = generated_text.strip()
-        corrected = smart_correct(raw_text)
+        with torch.inference_mode():
+            generated_ids = model.generate(pixel_values, max_new_tokens=MAX_NEW_TOKENS)
+        generated_texts = processor.batch_decode(generated_ids, skip_special_tokens=True)
 
-        result = corrected['best_result']
-        _text_cache[image_hash] = result
-
-        if len(_text_cache) > 100:
-            oldest_key = next(iter(_text_cache))
-            del _text_cache[oldest_key]
-
-        return result
+        return [text.strip() for text in generated_texts]
     except Exception as e:
         raise Exception(f"Text recognition failed: {str(e)}")
+
+
+def warmup() -> None:
+    """
+    Run one uncached generate call on a blank image, so CUDA kernel selection and
+    graph compilation happen before the first real request.
+    """
+    _generate_text([Image.new('RGB', (MAX_IMAGE_DIMENSION, MAX_IMAGE_DIMENSION), 'white')])
+
+
+def recognize_text(image_input: Union[str, bytes, Image.Image]) -> str:
+    if isinstance(image_input, str):
+        validate_image_input(image_input)
+
+    image = load_image(image_input)
+
+    cache_key = _cache_key(image)
+    raw_text = _text_cache.get(cache_key)
+    if raw_text is None:
+        raw_text = _generate_text([image])[0]
+        _text_cache[cache_key] = raw_text
+
+    return smart_correct(raw_text)['best_result']
+
+
+def recognize_text_batch(image_inputs: List[Union[str, bytes, Image.Image]]) -> List[str]:
+    """
+    Recognize text in several images with as few model.generate calls as possible.
+    Cached images are skipped; the rest are stacked into batches of at most MAX_BATCH_SIZE.
+    """
+    for image_input in image_inputs:
+        if isinstance(image_input, str):
+            validate_image_input(image_input)
+
+    with ThreadPoolExecutor(max_workers=min(8, len(image_inputs) or 1)) as executor:
+        images = list(executor.map(load_image, image_inputs))
+
+    cache_keys = [_cache_key(image) for image in images]
+    raw_texts = [_text_cache.get(key) for key in cache_keys]
+
+    missing = [i for i, text in enumerate(raw_texts) if text is None]
+    for start in range(0, len(missing), MAX_BATCH_SIZE):
+        batch = missing[start:start + MAX_BATCH_SIZE]
+        generated = _generate_text([images[i] for i in batch])
+        for i, text in zip(batch, generated):
+            raw_texts[i] = text
+            _text_cache[cache_keys[i]] = text
+
+    return [smart_correct(text)['best_result'] for text in raw_texts]
@@ -3,17 +3,14 @@
 Test script for OCR accuracy metrics
 """
 import sys
-from pathlib import Path
 
-# Add src to path
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
-
-from accuracy_metrics import (
+from src.accuracy_metrics import (
     calculate_cer,
     calculate_wer,
     calculate_accuracy,
+    calculate_levenshtein_distance,
     get_detailed_metrics,
+    get_detailed_metrics_batch,
     compare_engines
 )
 
@@ -98,6 +95,45 @@ def test_handwriting_scenario():
     print(f"  Predicted: {metrics['predicted_length']} chars, {metrics['predicted_word_count']} words")
 
 
+def test_bounded_distance():
+    """Test Levenshtein distance with a max_distance cutoff"""
+    print("\n" + "=" * 60)
+    print("Testing Bounded Levenshtein Distance")
+    print("=" * 60)
+
+    ground_truth = "The quick brown fox jumps over the lazy dog"
+    predicted = "The quik brown fox junps over the lasy dog"
+
+    exact = calculate_levenshtein_distance(ground_truth, predicted)
+    within = calculate_levenshtein_distance(ground_truth, predicted, max_distance=5)
+    exceeded = calculate_levenshtein_distance(ground_truth, predicted, max_distance=1)
+
+    print(f"\nExact distance: {exact}")
+    print(f"With max_distance=5: {within} (expected: {exact})")
+    print(f"With max_distance=1: {exceeded} (expected: 2, i.e. max_distance + 1)")
+
+
+def test_batch_metrics():
+    """Test batched metrics against one call per pair"""
+    print("\n" + "=" * 60)
+    print("Testing Batched Metrics")
+    print("=" * 60)
+
+    pairs = [
+        ("Hello World", "Hello World"),
+        ("Hello World", "Helo Wrld"),
+        ("The quick brown fox", "The quik brown fox"),
+        ("", "")
+    ]
+
+    batch = get_detailed_metrics_batch(pairs)
+    for (ground_truth, predicted), metrics in zip(pairs, batch):
+        single = get_detailed_metrics(ground_truth, predicted)
+        print(f"\n'{ground_truth}' vs '{predicted}': "
+              f"accuracy {metrics['character_accuracy']}% "
+              f"(matches single call: {metrics == single})")
+
+
 def test_engine_comparison():
     """Test comparing multiple OCR engines"""
     print("\n" + "=" * 60)
@@ -146,6 +182,8 @@ if __name__ == '__main__':
     try:
         test_basic_metrics()
         test_handwriting_scenario()
+        test_bounded_distance()
+        test_batch_metrics()
         test_engine_comparison()
 
         print("\n" + "=" * 60)
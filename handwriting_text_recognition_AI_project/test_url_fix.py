@@ -3,14 +3,7 @@
 Test script to verify URL image loading is working correctly
 """
 
-import sys
-from pathlib import Path
-
-# Add src to path
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
-
-from text_recognizer import load_image
+from src.text_recognizer import load_image
 
 # Test with a sample image URL
 test_urls = [
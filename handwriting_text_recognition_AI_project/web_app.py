@@ -1,24 +1,61 @@
 import os
-import sys
-from pathlib import Path
-from flask import Flask, render_template, request, jsonify
-from werkzeug.utils import secure_filename
-import base64
+import time
+import uuid
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from tempfile import SpooledTemporaryFile
+from quart import Quart, Request, render_template, request, jsonify
+from quart.json.provider import DefaultJSONProvider
 from io import BytesIO
 from PIL import Image
+import xxhash
+import orjson
 
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
+from src.config import MAX_BATCH_SIZE, MAX_IMAGE_DIMENSION, MAX_IMAGE_SIZE_MB
+from src.image_io import load_image
+from src.text_recognizer import recognize_text, recognize_text_batch, warmup
+from src.model_loader import model_loader
+from src.multi_ocr import recognize_multi
+from src.accuracy_metrics import get_detailed_metrics, get_detailed_metrics_batch, compare_engines
 
-from text_recognizer import recognize_text
-from model_loader import model_loader
-from multi_ocr import recognize_multi
-from accuracy_metrics import get_detailed_metrics, compare_engines
+UPLOAD_SPOOL_SIZE = 8 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 64 * 1024
+MAX_ACCURACY_PAIRS = 1000
 
-app = Flask(__name__)
+
+def spooled_stream_factory(total_content_length, content_type, filename, content_length=None):
+    # werkzeug's default sends every upload over 500 KB to a temporary file on disk;
+    # keep typical photos in memory and only spill larger ones.
+    return SpooledTemporaryFile(max_size=UPLOAD_SPOOL_SIZE, mode='rb+')
+
+
+class UploadRequest(Request):
+    def make_form_data_parser(self):
+        parser = super().make_form_data_parser()
+        parser.stream_factory = spooled_stream_factory
+        return parser
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, which serializes much faster than the stdlib encoder."""
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+app = Quart(__name__)
+app.request_class = UploadRequest
+app.json = OrjsonProvider(app)
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024
-app.config['UPLOAD_FOLDER'] = Path(__file__).parent / 'uploads'
-app.config['UPLOAD_FOLDER'].mkdir(exist_ok=True)
 
 print("\n" + "="*60)
 print("⏳ PRELOADING AI MODEL...")
@@ -32,6 +69,7 @@ import threading
 def preload_model():
     try:
         model_loader.load()
+        warmup()
         print("\n" + "="*60)
         print("✅ MODEL READY! All requests will now be INSTANT (<0.2s)")
         print("="*60 + "\n")
@@ -42,25 +80,186 @@ def preload_model():
 preload_thread = threading.Thread(target=preload_model, daemon=True)
 preload_thread.start()
 
-ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'bmp', 'tiff', 'webp'}
+ALLOWED_EXTENSIONS = frozenset({'png', 'jpg', 'jpeg', 'gif', 'bmp', 'tiff', 'webp'})
+
+PREVIEW_TTL_SECONDS = 300
+PREVIEW_CACHE_BYTES = 128 * 1024 * 1024
+
+# Preview id -> [expiry time, future of the JPEG bytes, encoded size]. Every entry
+# has the same TTL, so insertion order is also expiry order.
+_previews = OrderedDict()
+_previews_lock = threading.Lock()
+_preview_bytes = 0
+
+# Previews are encoded here while the OCR response is already on its way.
+_preview_executor = ThreadPoolExecutor(max_workers=2)
+
+# Requests allowed to run OCR at once; the rest wait on the event loop without
+# holding a worker thread. TrOCR itself always runs on text_recognizer's single
+# inference thread, whatever thread calls it.
+MAX_CONCURRENT_INFER = int(os.getenv('MAX_CONCURRENT_INFER', '1'))
+infer_semaphore = asyncio.Semaphore(MAX_CONCURRENT_INFER)
+
+UPLOAD_CACHE_SIZE = 256
+
+# (recognizer, its extra args, upload hash) -> (OCR result, preview JPEG future).
+# Re-submitting the same file skips decoding, every OCR engine and the thumbnail.
+_upload_cache = OrderedDict()
+_upload_cache_lock = threading.Lock()
 
 
 def allowed_file(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return os.path.splitext(filename)[1][1:].lower() in ALLOWED_EXTENSIONS
+
+
+def check_upload_size(raw: bytes) -> None:
+    # Same limit validate_image_input applies to files on disk.
+    size_mb = len(raw) / (1024 * 1024)
+    if size_mb > MAX_IMAGE_SIZE_MB:
+        raise ValueError(
+            f"Image file too large: {size_mb:.2f}MB. "
+            f"Maximum allowed: {MAX_IMAGE_SIZE_MB}MB"
+        )
+
+
+def load_upload(file) -> Image.Image:
+    """
+    Decode an uploaded file straight from memory for TrOCR. The same image is
+    used for recognition and for the preview, so nothing is written to disk.
+    """
+    raw = file.read()
+    check_upload_size(raw)
+    return load_image(raw, draft_size=MAX_IMAGE_DIMENSION)
+
+
+def load_batch_upload(file) -> Image.Image:
+    if not allowed_file(file.filename):
+        raise ValueError('Invalid file type')
+    return load_upload(file)
+
+
+def _drop_oldest_preview() -> None:
+    global _preview_bytes
+    _, (_, _, size) = _previews.popitem(last=False)
+    _preview_bytes -= size
+
+
+def _purge_expired_previews(now: float) -> None:
+    while _previews and next(iter(_previews.values()))[0] <= now:
+        _drop_oldest_preview()
+
+
+def _account_preview(preview_id: str, entry: list, preview: Future) -> None:
+    global _preview_bytes
+    if preview.cancelled() or preview.exception() is not None:
+        return
+
+    with _previews_lock:
+        if _previews.get(preview_id) is not entry:
+            return
+        entry[2] = len(preview.result())
+        _preview_bytes += entry[2]
+        # Entries normally leave by expiring. Past the byte budget, shed the oldest,
+        # which the browser has almost certainly fetched already.
+        while _preview_bytes > PREVIEW_CACHE_BYTES and len(_previews) > 1:
+            _drop_oldest_preview()
+
+
+def encode_preview(image: Image.Image, max_size: tuple) -> bytes:
+    image.thumbnail(max_size, Image.Resampling.BILINEAR)
+    buffered = BytesIO()
+    image.save(buffered, format="JPEG", quality=80, progressive=True)
+    return buffered.getvalue()
+
+
+def store_preview(preview: Future) -> str:
+    """
+    Keep a JPEG preview for PREVIEW_TTL_SECONDS and return the URL it is served
+    from. Responses carry this URL instead of an inline base64 copy; the preview
+    may still be encoding, and /preview waits for it.
+    """
+    preview_id = uuid.uuid4().hex
+    now = time.monotonic()
+    entry = [now + PREVIEW_TTL_SECONDS, preview, 0]
+    with _previews_lock:
+        _purge_expired_previews(now)
+        _previews[preview_id] = entry
+
+    # Size is only known once encoded; runs immediately if the preview is already done.
+    preview.add_done_callback(lambda future: _account_preview(preview_id, entry, future))
+    return f'/preview/{preview_id}'
+
+
+def make_preview(image: Image.Image, max_size: tuple) -> str:
+    """Start encoding the preview in the background and return its URL right away."""
+    return store_preview(_preview_executor.submit(encode_preview, image, max_size))
+
+
+def read_upload(file) -> tuple:
+    """Read an upload in one pass, hashing each chunk as it is copied. Returns (bytes, hash)."""
+    hasher = xxhash.xxh3_64()
+    raw = bytearray()
+    for chunk in iter(lambda: file.stream.read(UPLOAD_CHUNK_SIZE), b''):
+        hasher.update(chunk)
+        raw += chunk
+    return raw, hasher.intdigest()
+
+
+async def run_inference(fn, *args, **kwargs):
+    async with infer_semaphore:
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+
+async def process_upload(file, recognize, *args) -> tuple:
+    """
+    Run recognize(image, *args) on an uploaded file and build its 800x600 preview.
+    Returns (result, preview_url); identical uploads are answered from memory
+    without waiting for an inference slot.
+    """
+    raw, digest = await asyncio.to_thread(read_upload, file)
+    check_upload_size(raw)
+    key = (recognize, args, digest)
+
+    with _upload_cache_lock:
+        cached = _upload_cache.get(key)
+        if cached is not None:
+            _upload_cache.move_to_end(key)
+
+    if cached is None:
+        # JPEG draft only suits TrOCR, which resizes to MAX_IMAGE_DIMENSION anyway;
+        # EasyOCR and Tesseract get the upload at full resolution.
+        draft_size = MAX_IMAGE_DIMENSION if recognize is recognize_text else None
+        image = await asyncio.to_thread(load_image, raw, draft_size)
+        result = await run_inference(recognize, image, *args)
+        cached = (result, _preview_executor.submit(encode_preview, image, (800, 600)))
+
+        # Engine failures may be transient, so only fully successful results are kept.
+        failed = isinstance(result, list) and not all(r.get('success') for r in result)
+        if not failed:
+            with _upload_cache_lock:
+                _upload_cache[key] = cached
+                while len(_upload_cache) > UPLOAD_CACHE_SIZE:
+                    _upload_cache.popitem(last=False)
+
+    result, preview = cached
+    return result, store_preview(preview)
 
 
 @app.route('/')
-def index():
-    return render_template('index.html')
+async def index():
+    return await render_template('index.html')
 
 
 @app.route('/recognize', methods=['POST'])
-def recognize():
+async def recognize():
     try:
-        if 'file' not in request.files:
-            url = request.form.get('url', '').strip()
+        form = await request.form
+        uploads = await request.files
+
+        if 'file' not in uploads:
+            url = form.get('url', '').strip()
             if url:
-                text = recognize_text(url)
+                text = await run_inference(recognize_text, url)
                 return jsonify({
                     'success': True,
                     'text': text,
@@ -71,7 +270,7 @@ def recognize():
                 'error': 'No file or URL provided'
             }), 400
 
-        file = request.files['file']
+        file = uploads['file']
 
         if file.filename == '':
             return jsonify({
@@ -85,47 +284,55 @@ def recognize():
                 'error': f'Invalid file type. Allowed: {", ".join(ALLOWED_EXTENSIONS)}'
             }), 400
 
-        filename = secure_filename(file.filename)
-        filepath = app.config['UPLOAD_FOLDER'] / filename
-        file.save(filepath)
+        text, preview_url = await process_upload(file, recognize_text)
 
-        try:
-            text = recognize_text(str(filepath))
+        return jsonify({
+            'success': True,
+            'text': text,
+            'image': preview_url,
+            'message': 'Text recognized successfully!'
+        })
 
-            with Image.open(filepath) as img:
-                img.thumbnail((800, 600))
-                buffered = BytesIO()
-                img.save(buffered, format="PNG")
-                img_str = base64.b64encode(buffered.getvalue()).decode()
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
 
-            filepath.unlink()
 
-            return jsonify({
-                'success': True,
-                'text': text,
-                'image': f'data:image/png;base64,{img_str}',
-                'message': 'Text recognized successfully!'
-            })
+@app.route('/preview/<preview_id>')
+async def preview(preview_id):
+    with _previews_lock:
+        _purge_expired_previews(time.monotonic())
+        entry = _previews.get(preview_id)
 
-        except Exception as e:
-            if filepath.exists():
-                filepath.unlink()
-            raise e
+    if entry is None:
+        return jsonify({
+            'success': False,
+            'error': 'Preview not found or expired'
+        }), 404
 
+    try:
+        jpeg = await asyncio.wrap_future(entry[1])
     except Exception as e:
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
 
+    return jpeg, 200, {
+        'Content-Type': 'image/jpeg',
+        'Cache-Control': f'private, max-age={PREVIEW_TTL_SECONDS}'
+    }
+
 
 @app.route('/health')
-def health():
+async def health():
     return jsonify({'status': 'healthy'})
 
 
 @app.route('/model_status')
-def model_status():
+async def model_status():
     is_ready = model_loader.is_loaded()
     device = str(model_loader.get_device())
     return jsonify({
@@ -136,59 +343,65 @@ def model_status():
 
 
 @app.route('/recognize_batch', methods=['POST'])
-def recognize_batch_endpoint():
+async def recognize_batch_endpoint():
     try:
-        if 'files' not in request.files:
+        uploads = await request.files
+
+        if 'files' not in uploads:
             return jsonify({
                 'success': False,
                 'error': 'No files provided'
             }), 400
 
-        files = request.files.getlist('files')
+        files = uploads.getlist('files')
         if not files or len(files) == 0:
             return jsonify({
                 'success': False,
                 'error': 'No files selected'
             }), 400
 
-        results = []
-        for file in files:
-            if file.filename == '':
-                continue
+        files = [file for file in files if file.filename != '']
+
+        # Decode all uploads at once; Pillow releases the GIL while decoding.
+        images = await asyncio.gather(
+            *(asyncio.to_thread(load_batch_upload, file) for file in files),
+            return_exceptions=True
+        )
 
-            if not allowed_file(file.filename):
+        decoded = [i for i, image in enumerate(images) if not isinstance(image, Exception)]
+        texts, batch_errors = {}, {}
+        for start in range(0, len(decoded), MAX_BATCH_SIZE):
+            # One generate call per slice instead of one per file; a failure
+            # only affects the files in its own slice.
+            batch = decoded[start:start + MAX_BATCH_SIZE]
+            try:
+                batch_texts = await run_inference(recognize_text_batch, [images[i] for i in batch])
+                texts.update(zip(batch, batch_texts))
+            except Exception as e:
+                batch_errors.update((i, e) for i in batch)
+
+        results = []
+        for i, (file, image) in enumerate(zip(files, images)):
+            error = image if isinstance(image, Exception) else batch_errors.get(i)
+            if error is not None:
                 results.append({
                     'filename': file.filename,
                     'success': False,
-                    'error': 'Invalid file type'
+                    'error': str(error)
                 })
                 continue
 
-            filename = secure_filename(file.filename)
-            filepath = app.config['UPLOAD_FOLDER'] / filename
-
             try:
-                file.save(filepath)
-                text = recognize_text(str(filepath))
-
-                with Image.open(filepath) as img:
-                    img.thumbnail((400, 300))
-                    buffered = BytesIO()
-                    img.save(buffered, format="PNG")
-                    img_str = base64.b64encode(buffered.getvalue()).decode()
-
-                filepath.unlink()
+                preview_url = make_preview(image, (400, 300))
 
                 results.append({
                     'filename': file.filename,
                     'success': True,
-                    'text': text,
-                    'image': f'data:image/png;base64,{img_str}'
+                    'text': texts[i],
+                    'image': preview_url
                 })
 
             except Exception as e:
-                if filepath.exists():
-                    filepath.unlink()
                 results.append({
                     'filename': file.filename,
                     'success': False,
@@ -209,12 +422,15 @@ def recognize_batch_endpoint():
 
 
 @app.route('/recognize_multi', methods=['POST'])
-def recognize_multi_endpoint():
+async def recognize_multi_endpoint():
     try:
-        if 'file' not in request.files:
-            url = request.form.get('url', '').strip()
+        form = await request.form
+        uploads = await request.files
+
+        if 'file' not in uploads:
+            url = form.get('url', '').strip()
             if url:
-                results = recognize_multi(url, engines=['trocr', 'easyocr'])
+                results = await run_inference(recognize_multi, url, engines=['trocr', 'easyocr'])
                 return jsonify({
                     'success': True,
                     'results': results,
@@ -225,7 +441,7 @@ def recognize_multi_endpoint():
                 'error': 'No file or URL provided'
             }), 400
 
-        file = request.files['file']
+        file = uploads['file']
 
         if file.filename == '':
             return jsonify({
@@ -239,32 +455,14 @@ def recognize_multi_endpoint():
                 'error': f'Invalid file type'
             }), 400
 
-        filename = secure_filename(file.filename)
-        filepath = app.config['UPLOAD_FOLDER'] / filename
-        file.save(filepath)
-
-        try:
-            results = recognize_multi(str(filepath), engines=['trocr', 'easyocr'])
-
-            with Image.open(filepath) as img:
-                img.thumbnail((800, 600))
-                buffered = BytesIO()
-                img.save(buffered, format="PNG")
-                img_str = base64.b64encode(buffered.getvalue()).decode()
-
-            filepath.unlink()
+        results, preview_url = await process_upload(file, recognize_multi, ('trocr', 'easyocr'))
 
-            return jsonify({
-                'success': True,
-                'results': results,
-                'image': f'data:image/png;base64,{img_str}',
-                'message': 'Processed with multiple engines'
-            })
-
-        except Exception as e:
-            if filepath.exists():
-                filepath.unlink()
-            raise e
+        return jsonify({
+            'success': True,
+            'results': results,
+            'image': preview_url,
+            'message': 'Processed with multiple engines'
+        })
 
     except Exception as e:
         return jsonify({
@@ -274,13 +472,13 @@ def recognize_multi_endpoint():
 
 
 @app.route('/calculate_accuracy', methods=['POST'])
-def calculate_accuracy_endpoint():
+async def calculate_accuracy_endpoint():
     """
     Calculate accuracy metrics by comparing OCR result with ground truth.
     Expects JSON: { "ground_truth": "...", "predicted": "..." }
     """
     try:
-        data = request.get_json()
+        data = await request.get_json()
         if not data:
             return jsonify({
                 'success': False,
@@ -311,18 +509,80 @@ def calculate_accuracy_endpoint():
         }), 500
 
 
+@app.route('/calculate_accuracy_batch', methods=['POST'])
+async def calculate_accuracy_batch_endpoint():
+    """
+    Calculate accuracy metrics for many OCR results in one request.
+    Expects JSON: [{ "ground_truth": "...", "predicted": "..." }, ...]
+    """
+    try:
+        data = await request.get_json()
+        if not isinstance(data, list) or not data:
+            return jsonify({
+                'success': False,
+                'error': 'Expected a non-empty JSON array of pairs'
+            }), 400
+
+        if len(data) > MAX_ACCURACY_PAIRS:
+            return jsonify({
+                'success': False,
+                'error': f'Too many pairs: {len(data)}. Maximum allowed: {MAX_ACCURACY_PAIRS}'
+            }), 400
+
+        pairs = []
+        for index, item in enumerate(data):
+            if not isinstance(item, dict):
+                return jsonify({
+                    'success': False,
+                    'error': f'Expected an object with ground_truth and predicted (item {index})'
+                }), 400
+
+            ground_truth = item.get('ground_truth', '')
+            predicted = item.get('predicted', '')
+            if not isinstance(ground_truth, str) or not isinstance(predicted, str):
+                return jsonify({
+                    'success': False,
+                    'error': f'ground_truth and predicted must be strings (item {index})'
+                }), 400
+
+            ground_truth = ground_truth.strip()
+            if not ground_truth:
+                return jsonify({
+                    'success': False,
+                    'error': f'Ground truth text is required (item {index})'
+                }), 400
+            pairs.append((ground_truth, predicted.strip()))
+
+        # Edit distances over many pairs are CPU-bound; keep them off the event loop.
+        metrics = await asyncio.to_thread(get_detailed_metrics_batch, pairs)
+
+        return jsonify({
+            'success': True,
+            'metrics': metrics,
+            'message': f'Accuracy calculated for {len(metrics)} pairs'
+        })
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
 @app.route('/recognize_with_accuracy', methods=['POST'])
-def recognize_with_accuracy():
+async def recognize_with_accuracy():
     """
     Recognize text and optionally calculate accuracy if ground truth is provided.
     """
     try:
-        ground_truth = request.form.get('ground_truth', '').strip()
+        form = await request.form
+        uploads = await request.files
+        ground_truth = form.get('ground_truth', '').strip()
 
-        if 'file' not in request.files:
-            url = request.form.get('url', '').strip()
+        if 'file' not in uploads:
+            url = form.get('url', '').strip()
             if url:
-                text = recognize_text(url)
+                text = await run_inference(recognize_text, url)
                 response_data = {
                     'success': True,
                     'text': text,
@@ -340,7 +600,7 @@ def recognize_with_accuracy():
                 'error': 'No file or URL provided'
             }), 400
 
-        file = request.files['file']
+        file = uploads['file']
 
         if file.filename == '':
             return jsonify({
@@ -354,38 +614,20 @@ def recognize_with_accuracy():
                 'error': f'Invalid file type. Allowed: {", ".join(ALLOWED_EXTENSIONS)}'
             }), 400
 
-        filename = secure_filename(file.filename)
-        filepath = app.config['UPLOAD_FOLDER'] / filename
-        file.save(filepath)
-
-        try:
-            text = recognize_text(str(filepath))
+        text, preview_url = await process_upload(file, recognize_text)
 
-            with Image.open(filepath) as img:
-                img.thumbnail((800, 600))
-                buffered = BytesIO()
-                img.save(buffered, format="PNG")
-                img_str = base64.b64encode(buffered.getvalue()).decode()
-
-            filepath.unlink()
-
-            response_data = {
-                'success': True,
-                'text': text,
-                'image': f'data:image/png;base64,{img_str}',
-                'message': 'Text recognized successfully!'
-            }
-
-            if ground_truth:
-                metrics = get_detailed_metrics(ground_truth, text)
-                response_data['accuracy_metrics'] = metrics
+        response_data = {
+            'success': True,
+            'text': text,
+            'image': preview_url,
+            'message': 'Text recognized successfully!'
+        }
 
-            return jsonify(response_data)
+        if ground_truth:
+            metrics = get_detailed_metrics(ground_truth, text)
+            response_data['accuracy_metrics'] = metrics
 
-        except Exception as e:
-            if filepath.exists():
-                filepath.unlink()
-            raise e
+        return jsonify(response_data)
 
     except Exception as e:
         return jsonify({
@@ -395,17 +637,19 @@ def recognize_with_accuracy():
 
 
 @app.route('/recognize_multi_with_accuracy', methods=['POST'])
-def recognize_multi_with_accuracy():
+async def recognize_multi_with_accuracy():
     """
     Recognize text with multiple engines and calculate accuracy if ground truth is provided.
     """
     try:
-        ground_truth = request.form.get('ground_truth', '').strip()
+        form = await request.form
+        uploads = await request.files
+        ground_truth = form.get('ground_truth', '').strip()
 
-        if 'file' not in request.files:
-            url = request.form.get('url', '').strip()
+        if 'file' not in uploads:
+            url = form.get('url', '').strip()
             if url:
-                results = recognize_multi(url, engines=['trocr', 'easyocr'])
+                results = await run_inference(recognize_multi, url, engines=['trocr', 'easyocr'])
 
                 if ground_truth:
                     results = compare_engines(ground_truth, results)
@@ -422,7 +666,7 @@ def recognize_multi_with_accuracy():
                 'error': 'No file or URL provided'
             }), 400
 
-        file = request.files['file']
+        file = uploads['file']
 
         if file.filename == '':
             return jsonify({
@@ -436,36 +680,18 @@ def recognize_multi_with_accuracy():
                 'error': f'Invalid file type'
             }), 400
 
-        filename = secure_filename(file.filename)
-        filepath = app.config['UPLOAD_FOLDER'] / filename
-        file.save(filepath)
+        results, preview_url = await process_upload(file, recognize_multi, ('trocr', 'easyocr'))
 
-        try:
-            results = recognize_multi(str(filepath), engines=['trocr', 'easyocr'])
+        if ground_truth:
+            results = compare_engines(ground_truth, results)
 
-            if ground_truth:
-                results = compare_engines(ground_truth, results)
-
-            with Image.open(filepath) as img:
-                img.thumbnail((800, 600))
-                buffered = BytesIO()
-                img.save(buffered, format="PNG")
-                img_str = base64.b64encode(buffered.getvalue()).decode()
-
-            filepath.unlink()
-
-            return jsonify({
-                'success': True,
-                'results': results,
-                'ground_truth': ground_truth if ground_truth else None,
-                'image': f'data:image/png;base64,{img_str}',
-                'message': 'Processed with multiple engines'
-            })
-
-        except Exception as e:
-            if filepath.exists():
-                filepath.unlink()
-            raise e
+        return jsonify({
+            'success': True,
+            'results': results,
+            'ground_truth': ground_truth if ground_truth else None,
+            'image': preview_url,
+            'message': 'Processed with multiple engines'
+        })
 
     except Exception as e:
         return jsonify({